@@ -7,8 +7,11 @@ import shutil
 import subprocess
 import time
 from datetime import datetime
-from urllib.parse import urlparse
+from functools import lru_cache
+from itertools import chain, islice
+from urllib.parse import urlparse, urlsplit
 
+import orjson as json
 import requests
 from PySide6.QtCore import QBuffer, QRect, QSize, Qt, QThread, QTimer, Signal
 from PySide6.QtGui import (
@@ -50,6 +53,60 @@ from content_loader import ContentLoader
 from image_loader import ImageLoader
 from options import OptionsDialog
 
+# Resolved once, the platform does not change during a session
+PLATFORM = platform.system()
+WINDOWS_VLC_PATH = os.path.join(
+    os.environ.get("ProgramFiles", "C:\\Program Files"), "VideoLAN", "VLC", "vlc.exe"
+)
+MACOS_VLC_PATHS = tuple(
+    os.path.expanduser(path)
+    for path in (
+        "/Applications/VLC.app/Contents/MacOS/VLC",
+        "~/Applications/VLC.app/Contents/MacOS/VLC",
+    )
+)
+
+# Background of favorite rows, shared by every highlighted item
+FAVORITE_COLOR = QColor(0, 0, 255, 20)
+
+# Patterns used when rewriting localhost STB links on export
+CH_ID_RE = re.compile(r"/ch/(\d+)_")
+CONTENT_ID_RE = re.compile(r"/(ch|vod)/(\d+)_")
+FFMPEG_PREFIX = "ffmpeg "
+EXPORT_BATCH_SIZE = 1024  # Number of entries joined per write when exporting
+EXPORT_BUFFER_SIZE = 1 << 20  # Write exported playlists in 1 MiB chunks
+
+# Attributes read from #EXTINF lines when parsing M3U playlists
+TVG_ID_RE = re.compile(r'tvg-id="([^"]+)"')
+TVG_LOGO_RE = re.compile(r'tvg-logo="([^"]+)"')
+GROUP_TITLE_RE = re.compile(r'group-title="([^"]+)"')
+USER_AGENT_RE = re.compile(r'user-agent="([^"]+)"')
+ITEM_NAME_RE = re.compile(r",([^,]+)$")
+
+# STB portal create_link endpoints, filled in by create_link
+CREATE_LINK_URL = (
+    "{base}/server/load.php?type={type}&action=create_link&cmd={cmd}&JsHttpRequest=1-xml"
+)
+CREATE_LINK_EPISODE_URL = (
+    "{base}/server/load.php?type={type}&action=create_link&cmd={cmd}"
+    "&series={series}&JsHttpRequest=1-xml"
+)
+
+
+@lru_cache(maxsize=1)
+def find_vlc_binary():
+    # Locate VLC once, probing PATH and the usual install locations
+    vlc_path = shutil.which("vlc")  # Try to find VLC in PATH
+    if vlc_path:
+        return vlc_path
+    if PLATFORM == "Windows":
+        return WINDOWS_VLC_PATH
+    if PLATFORM == "Darwin":  # macOS
+        for path in MACOS_VLC_PATHS:
+            if os.path.isfile(path):
+                return path
+    return None
+
 
 class CategoryTreeWidgetItem(QTreeWidgetItem):
     # sort to always have value "All" first and "Unknown Category" last
@@ -285,8 +342,39 @@ class SetProviderThread(QThread):
             print(f"Error in initializing provider: {e}")
 
 
-class ChannelList(QMainWindow):
+class StbCategoriesThread(QThread):
+    categories_loaded = Signal(dict)
+
+    def __init__(self, channel_list, url, headers, content_type):
+        super().__init__()
+        self.channel_list = channel_list
+        self.url = url
+        self.headers = headers
+        self.content_type = content_type
+
+    def run(self):
+        provider_content = self.channel_list.fetch_stb_categories(
+            self.url, self.headers, self.content_type
+        )
+        if provider_content:
+            self.categories_loaded.emit(provider_content)
+
+
+class LinkCreatorThread(QThread):
+    link_created = Signal(str)
+
+    def __init__(self, channel_list, item, is_episode=False):
+        super().__init__(channel_list)
+        self.channel_list = channel_list
+        self.item = item
+        self.is_episode = is_episode
+
+    def run(self):
+        link = self.channel_list.create_link(self.item, is_episode=self.is_episode)
+        self.link_created.emit(link or "")
+
 
+class ChannelList(QMainWindow):
     def __init__(
         self, app, player, config_manager, provider_manager, image_manager, epg_manager
     ):
@@ -309,6 +397,7 @@ class ChannelList(QMainWindow):
         self.content_type = "itv"  # Default to channels (STB type)
         self.current_list_content = None
         self.content_info_show = None
+        self.stopping_image_loader = None
 
         self.create_upper_panel()
         self.create_list_panel()
@@ -338,6 +427,7 @@ class ChannelList(QMainWindow):
         self.current_series = None
         self.current_season = None
         self.navigation_stack = []  # To keep track of navigation for back button
+        self.search_index = []  # (item, name, lowercase name) of the listed items
 
         # Connect player signals to show/hide media controls
         self.player.playing.connect(self.show_media_controls)
@@ -352,6 +442,12 @@ class ChannelList(QMainWindow):
         self.refresh_on_air_timer = QTimer(self)
         self.refresh_on_air_timer.timeout.connect(self.refresh_on_air)
 
+        # Create a timer to coalesce config writes (e.g. rapid favorite toggles)
+        self.save_config_timer = QTimer(self)
+        self.save_config_timer.setSingleShot(True)
+        self.save_config_timer.setInterval(500)
+        self.save_config_timer.timeout.connect(self.save_config)
+
         self.update_layout()
 
         self.set_provider()
@@ -362,6 +458,9 @@ class ChannelList(QMainWindow):
             self.refresh_on_air_timer.stop()
         self.refresh_on_air_timer.deleteLater()
 
+        # Pending config write is flushed by save_window_settings below
+        self.save_config_timer.stop()
+
         self.app.quit()
         self.player.close()
         self.image_manager.save_index()
@@ -371,12 +470,15 @@ class ChannelList(QMainWindow):
 
     def refresh_on_air(self):
         epg_source = self.config_manager.epg_source
+        # All listed items share the current content type, decide once per refresh
+        use_epg = self.config_manager.channel_epg and self.can_show_epg(
+            self.current_list_content
+        )
         for i in range(self.content_list.topLevelItemCount()):
             item = self.content_list.topLevelItem(i)
             item_data = item.data(0, Qt.UserRole)
-            content_type = item_data.get("type")
 
-            if self.config_manager.channel_epg and self.can_show_epg(content_type):
+            if use_epg:
                 epg_data = self.epg_manager.get_programs_for_channel(
                     item_data["data"], None, 1
                 )
@@ -592,12 +694,12 @@ class ChannelList(QMainWindow):
 
     def show_vodinfo(self):
         self.config_manager.show_stb_content_info = self.vodinfo_checkbox.isChecked()
-        self.save_config()
+        self.schedule_save_config()
         self.item_selected()
 
     def show_epg(self):
         self.config_manager.channel_epg = self.epg_checkbox.isChecked()
-        self.save_config()
+        self.schedule_save_config()
 
         # Refresh the EPG data
         self.epg_manager.set_current_epg()
@@ -924,8 +1026,7 @@ class ChannelList(QMainWindow):
                 icon_url = item_data.get("icon", {}).get("@src")
                 if icon_url:
                     self.lock_ui_before_loading()
-                    if hasattr(self, "image_loader") and self.image_loader.isRunning():
-                        self.image_loader.wait()
+                    self.cancel_image_loader()
                     self.image_loader = ImageLoader(
                         [
                             icon_url,
@@ -935,7 +1036,7 @@ class ChannelList(QMainWindow):
                     )
                     self.image_loader.progress_updated.connect(self.update_poster)
                     self.image_loader.finished.connect(self.image_loader_finished)
-                    self.image_loader.start()
+                    self.start_image_loader()
                     self.cancel_button.setText("Cancel fetching poster...")
         else:
             self.content_info_text.setText("No data available")
@@ -967,8 +1068,7 @@ class ChannelList(QMainWindow):
         poster_url = item_data.get("screenshot_uri", "")
         if poster_url:
             self.lock_ui_before_loading()
-            if hasattr(self, "image_loader") and self.image_loader.isRunning():
-                self.image_loader.wait()
+            self.cancel_image_loader()
             self.image_loader = ImageLoader(
                 [
                     poster_url,
@@ -978,7 +1078,7 @@ class ChannelList(QMainWindow):
             )
             self.image_loader.progress_updated.connect(self.update_poster)
             self.image_loader.finished.connect(self.image_loader_finished)
-            self.image_loader.start()
+            self.start_image_loader()
             self.cancel_button.setText("Cancel fetching poster...")
 
     def refresh_content_list_size(self):
@@ -1012,43 +1112,30 @@ class ChannelList(QMainWindow):
         if selected_item:
             item_type = self.get_item_type(selected_item)
             item_name = self.get_item_name(selected_item, item_type)
-            is_favorite = self.check_if_favorite(item_name)
-            if is_favorite:
-                self.remove_from_favorites(item_name)
-            else:
-                self.add_to_favorites(item_name)
+            self.config_manager.toggle_favorite(item_name)
+            self.schedule_save_config()
             self.filter_content(self.search_box.text())
 
-    def add_to_favorites(self, item_name):
-        if item_name not in self.config_manager.favorites:
-            self.config_manager.favorites.append(item_name)
-            self.save_config()
-
-    def remove_from_favorites(self, item_name):
-        if item_name in self.config_manager.favorites:
-            self.config_manager.favorites.remove(item_name)
-            self.save_config()
-
     def check_if_favorite(self, item_name):
-        return item_name in self.config_manager.favorites
+        return item_name in self.config_manager.favorites_set
 
     def rescan_logos(self):
         # Loop on content_list items to get logos and delete them from image_manager
-        logo_urls = []
-        for i in range(self.content_list.topLevelItemCount()):
-            item = self.content_list.topLevelItem(i)
-            url_logo = item.data(0, Qt.UserRole)["data"].get("logo", "")
-            logo_urls.append(url_logo)
+        top_level_item = self.content_list.topLevelItem
+        logo_urls = [
+            top_level_item(i).data(0, Qt.UserRole)["data"].get("logo", "")
+            for i in range(self.content_list.topLevelItemCount())
+        ]
+        for url_logo in logo_urls:
             if url_logo:
                 self.image_manager.remove_icon_from_cache(url_logo)
 
         self.lock_ui_before_loading()
-        if hasattr(self, "image_loader") and self.image_loader.isRunning():
-            self.image_loader.wait()
+        self.cancel_image_loader()
         self.image_loader = ImageLoader(logo_urls, self.image_manager, iconified=True)
         self.image_loader.progress_updated.connect(self.update_channel_logos)
         self.image_loader.finished.connect(self.image_loader_finished)
-        self.image_loader.start()
+        self.start_image_loader()
         self.cancel_button.setText("Cancel fetching channel logos...")
 
     def toggle_content_type(self):
@@ -1104,13 +1191,22 @@ class ChannelList(QMainWindow):
         self.epg_checkbox.setVisible(False)
         self.vodinfo_checkbox.setVisible(False)
 
-        for category in categories:
-            item = CategoryTreeWidgetItem(self.content_list)
-            item.setText(0, category.get("title", "Unknown Category"))
-            item.setData(0, Qt.UserRole, {"type": "category", "data": category})
-            # Highlight favorite items
-            if self.check_if_favorite(category.get("title", "")):
-                item.setBackground(0, QColor(0, 0, 255, 20))
+        favorites = self.config_manager.favorites_set
+        search_index = self.search_index = []
+        # Fill the list without repainting it for every inserted row
+        self.content_list.setUpdatesEnabled(False)
+        try:
+            for category in categories:
+                item = CategoryTreeWidgetItem(self.content_list)
+                item_name = category.get("title", "Unknown Category")
+                item.setText(0, item_name)
+                search_index.append((item, item_name, item_name.lower()))
+                item.setData(0, Qt.UserRole, {"type": "category", "data": category})
+                # Highlight favorite items
+                if category.get("title", "") in favorites:
+                    item.setBackground(0, FAVORITE_COLOR)
+        finally:
+            self.content_list.setUpdatesEnabled(True)
 
         self.content_list.sortItems(0, Qt.AscendingOrder)
         self.content_list.setSortingEnabled(True)
@@ -1218,34 +1314,47 @@ class ChannelList(QMainWindow):
         # no favorites on seasons or episodes genre_sfolders
         check_fav = content in ["channel", "movie", "serie", "m3ucontent"]
         self.show_favorite_layout(check_fav)
+        favorites = self.config_manager.favorites_set
+        search_index = self.search_index = []
+
+        # Resolve what every row shares once, not per item
+        if content == "channel":
+            item_class = ChannelTreeWidgetItem
+        elif content in ["season", "episode"]:
+            item_class = NumberedTreeWidgetItem
+        else:
+            item_class = QTreeWidgetItem
+        columns = list(enumerate(header_info[content]["keys"]))
 
-        for item_data in items:
-            if content == "channel":
-                list_item = ChannelTreeWidgetItem(self.content_list)
-            elif content in ["season", "episode"]:
-                list_item = NumberedTreeWidgetItem(self.content_list)
-            else:
-                list_item = QTreeWidgetItem(self.content_list)
-
-            for i, key in enumerate(header_info[content]["keys"]):
-                if key == "added":
-                    # Change a date time from "YYYY-MM-DD HH:MM:SS" to "YYYY-MM-DD" only
-                    list_item.setText(
-                        i, html.unescape(item_data.get(key, "")).split()[0]
-                    )
-                else:
-                    list_item.setText(i, html.unescape(item_data.get(key, "")))
+        # Fill the list without repainting it for every inserted row
+        self.content_list.setUpdatesEnabled(False)
+        try:
+            for item_data in items:
+                list_item = item_class(self.content_list)
+
+                for i, key in columns:
+                    if key == "added":
+                        # Change a date time from "YYYY-MM-DD HH:MM:SS" to "YYYY-MM-DD" only
+                        list_item.setText(
+                            i, html.unescape(item_data.get(key, "")).split()[0]
+                        )
+                    else:
+                        list_item.setText(i, html.unescape(item_data.get(key, "")))
 
-            list_item.setData(0, Qt.UserRole, {"type": content, "data": item_data})
+                list_item.setData(0, Qt.UserRole, {"type": content, "data": item_data})
+                list_name = self.get_item_name(list_item, content)
+                search_index.append((list_item, list_name, list_name.lower()))
 
-            # If content type is channel, collect the logo urls from the image_manager
-            if need_logos:
-                logo_urls.append(item_data.get("logo", ""))
+                # If content type is channel, collect the logo urls from the image_manager
+                if need_logos:
+                    logo_urls.append(item_data.get("logo", ""))
 
-            # Highlight favorite items
-            item_name = item_data.get("name") or item_data.get("title")
-            if check_fav and self.check_if_favorite(item_name):
-                list_item.setBackground(0, QColor(0, 0, 255, 20))
+                # Highlight favorite items
+                item_name = item_data.get("name") or item_data.get("title")
+                if check_fav and item_name in favorites:
+                    list_item.setBackground(0, FAVORITE_COLOR)
+        finally:
+            self.content_list.setUpdatesEnabled(True)
 
         for i in range(len(header_info[content]["headers"])):
             if i != 2:  # Don't auto-resize the progress column
@@ -1289,14 +1398,13 @@ class ChannelList(QMainWindow):
         self.rescanlogo_button.setVisible(need_logos)
         if need_logos:
             self.lock_ui_before_loading()
-            if hasattr(self, "image_loader") and self.image_loader.isRunning():
-                self.image_loader.wait()
+            self.cancel_image_loader()
             self.image_loader = ImageLoader(
                 logo_urls, self.image_manager, iconified=True
             )
             self.image_loader.progress_updated.connect(self.update_channel_logos)
             self.image_loader.finished.connect(self.image_loader_finished)
-            self.image_loader.start()
+            self.start_image_loader()
             self.cancel_button.setText("Cancel fetching channel logos...")
 
     def update_channel_logos(self, current, total, data):
@@ -1326,28 +1434,29 @@ class ChannelList(QMainWindow):
                 self.content_info_text.setText(img_tag + self.content_info_text.text())
 
     def filter_content(self, text=""):
-        show_favorites = self.favorites_only_checkbox.isChecked()
         search_text = text.lower() if isinstance(text, str) else ""
+        if not self.search_index:
+            return
 
         # retrieve items type first
-        if self.content_list.topLevelItemCount() > 0:
-            item = self.content_list.topLevelItem(0)
-            item_type = self.get_item_type(item)
-
-        for i in range(self.content_list.topLevelItemCount()):
-            item = self.content_list.topLevelItem(i)
-            item_name = self.get_item_name(item, item_type)
-            matches_search = search_text in item_name.lower()
-            if item_type in ["category", "channel", "movie", "serie", "m3ucontent"]:
-                # For category, channel, movie, serie and generic content, filter by search text and favorite
-                is_favorite = self.check_if_favorite(item_name)
-                if show_favorites and not is_favorite:
-                    item.setHidden(True)
-                else:
-                    item.setHidden(not matches_search)
-            else:
-                # For season, episode, only filter by search text
-                item.setHidden(not matches_search)
+        item_type = self.get_item_type(self.content_list.topLevelItem(0))
+        # For category, channel, movie, serie and generic content, filter by search text and favorite.
+        # For season, episode, only filter by search text
+        favorites_only = self.favorites_only_checkbox.isChecked() and item_type in [
+            "category",
+            "channel",
+            "movie",
+            "serie",
+            "m3ucontent",
+        ]
+        favorites = self.config_manager.favorites_set
+
+        # Names were lowered once when the list was built, not on every keystroke
+        for item, item_name, item_name_lower in self.search_index:
+            item.setHidden(
+                (favorites_only and item_name not in favorites)
+                or search_text not in item_name_lower
+            )
 
     def create_media_controls(self):
         self.media_controls = QWidget(self.container_widget)
@@ -1388,35 +1497,18 @@ class ChannelList(QMainWindow):
         # Invoke user's VLC player to open the current stream
         if self.link:
             try:
-                if platform.system() == "Windows":
-                    vlc_path = shutil.which("vlc")  # Try to find VLC in PATH
-                    if not vlc_path:
-                        program_files = os.environ.get(
-                            "ProgramFiles", "C:\\Program Files"
-                        )
-                        vlc_path = os.path.join(
-                            program_files, "VideoLAN", "VLC", "vlc.exe"
-                        )
-                    subprocess.Popen([vlc_path, self.link])
-                elif platform.system() == "Darwin":  # macOS
-                    vlc_path = shutil.which("vlc")  # Try to find VLC in PATH
-                    if not vlc_path:
-                        common_paths = [
-                            "/Applications/VLC.app/Contents/MacOS/VLC",
-                            "~/Applications/VLC.app/Contents/MacOS/VLC",
-                        ]
-                        for path in common_paths:
-                            expanded_path = os.path.expanduser(path)
-                            if os.path.exists(expanded_path):
-                                vlc_path = expanded_path
-                                break
-                    subprocess.Popen([vlc_path, self.link])
-                else:  # Assuming Linux or other Unix-like OS
-                    vlc_path = shutil.which("vlc")  # Try to find VLC in PATH
-                    subprocess.Popen([vlc_path, self.link])
+                vlc_path = find_vlc_binary()
+                if not vlc_path:
+                    # Not installed yet, look it up again on next click
+                    find_vlc_binary.cache_clear()
+                    print("VLC not found")
+                    return
+                subprocess.Popen([vlc_path, self.link])
                 # when VLC opens, stop running video on self.player
                 self.player.stop_video()
             except FileNotFoundError as fnf_error:
+                # VLC was moved or removed, look it up again on next click
+                find_vlc_binary.cache_clear()
                 print("VLC not found: ", fnf_error)
             except Exception as e:
                 print(f"Error opening VLC: {e}")
@@ -1482,30 +1574,58 @@ class ChannelList(QMainWindow):
         self, base_url, channels_data, categories, mac, file_path
     ) -> None:
         try:
-            with open(file_path, "w", encoding="utf-8") as file:
-                file.write("#EXTM3U\n")
+            # Bypass the text I/O layers: encode each batch once and write the
+            # bytes straight to the file descriptor (LF newlines on all platforms)
+            fd = os.open(
+                file_path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+                0o644,
+            )
+            try:
+                ChannelList.write_fd(fd, b"#EXTM3U\n")
                 count = 0
-                for channel in channels_data:
-                    name = channel.get("name", "Unknown Channel")
-                    logo = channel.get("logo", "")
-                    category = channel.get("tv_genre_id", "None")
-                    xmltv_id = channel.get("xmltv_id", "")
-                    group = categories.get(category, "Unknown Group")
-                    cmd_url = channel.get("cmd", "").replace("ffmpeg ", "")
-                    if "localhost" in cmd_url:
-                        ch_id_match = re.search(r"/ch/(\d+)_", cmd_url)
-                        if ch_id_match:
-                            ch_id = ch_id_match.group(1)
-                            cmd_url = f"{base_url}/play/live.php?mac={mac}&stream={ch_id}&extension=m3u8"
-
-                    channel_str = f'#EXTINF:-1  tvg-id="{xmltv_id}" tvg-logo="{logo}" group-title="{group}" ,{name}\n{cmd_url}\n'
-                    count += 1
-                    file.write(channel_str)
-                print(f"Channels = {count}")
-                print(f"\nChannel list has been dumped to {file_path}")
+                entries = self.iter_channel_entries(
+                    base_url, channels_data, categories, mac
+                )
+                # Write entries in joined batches pulled from the generator
+                while batch := list(islice(entries, EXPORT_BATCH_SIZE)):
+                    ChannelList.write_fd(fd, "".join(batch).encode("utf-8"))
+                    count += len(batch)
+            finally:
+                os.close(fd)
+            print(f"Channels = {count}")
+            print(f"\nChannel list has been dumped to {file_path}")
         except IOError as e:
             print(f"Error saving channel list: {e}")
 
+    @staticmethod
+    def write_fd(fd, data):
+        # os.write may write less than requested, loop until everything is out
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+
+    @staticmethod
+    def iter_channel_entries(base_url, channels_data, categories, mac):
+        # Hoist loop invariants out of the per-channel loop
+        live_prefix = f"{base_url}/play/live.php?mac={mac}&stream="
+        live_suffix = "&extension=m3u8"
+        categories_get = categories.get
+        ch_id_search = CH_ID_RE.search
+        for channel in channels_data:
+            get = channel.get
+            name = get("name", "Unknown Channel")
+            logo = get("logo", "")
+            xmltv_id = get("xmltv_id", "")
+            group = categories_get(get("tv_genre_id", "None"), "Unknown Group")
+            cmd_url = get("cmd", "").replace(FFMPEG_PREFIX, "")
+            if "localhost" in cmd_url:
+                ch_id_match = ch_id_search(cmd_url)
+                if ch_id_match:
+                    cmd_url = live_prefix + ch_id_match.group(1) + live_suffix
+
+            yield f'#EXTINF:-1  tvg-id="{xmltv_id}" tvg-logo="{logo}" group-title="{group}" ,{name}\n{cmd_url}\n'
+
     def export_content(self):
         file_dialog = QFileDialog(self)
         file_dialog.setAcceptMode(QFileDialog.AcceptSave)
@@ -1527,10 +1647,10 @@ class ChannelList(QMainWindow):
             mac = provider.get("mac", "")
 
             if config_type == "STB":
-                # Extract all content items from categories
-                all_items = []
-                for items in provider_content.get("contents", {}).values():
-                    all_items.extend(items)
+                # Stream content items category by category instead of copying them all
+                all_items = chain.from_iterable(
+                    provider_content.get("contents", {}).values()
+                )
                 self.save_stb_content(base_url, all_items, mac, file_path)
             elif config_type in ["M3UPLAYLIST", "M3USTREAM", "XTREAM"]:
                 content_items = provider_content if provider_content else []
@@ -1541,21 +1661,18 @@ class ChannelList(QMainWindow):
     @staticmethod
     def save_m3u_content(content_data, file_path):
         try:
-            with open(file_path, "w", encoding="utf-8") as file:
+            # Format every entry first, then hand them to the file in one call
+            lines = [
+                f'#EXTINF:-1 tvg-id="{item.get("xmltv_id", "")}" tvg-logo="{item.get("logo", "")}" group-title="{item.get("group", "")}" ,{item.get("name", "Unknown")}\n{cmd_url}\n'
+                for item in content_data
+                if (cmd_url := item.get("cmd"))
+            ]
+            with open(
+                file_path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE
+            ) as file:
                 file.write("#EXTM3U\n")
-                count = 0
-                for item in content_data:
-                    name = item.get("name", "Unknown")
-                    logo = item.get("logo", "")
-                    group = item.get("group", "")
-                    xmltv_id = item.get("xmltv_id", "")
-                    cmd_url = item.get("cmd")
-
-                    if cmd_url:
-                        item_str = f'#EXTINF:-1 tvg-id="{xmltv_id}" tvg-logo="{logo}" group-title="{group}" ,{name}\n{cmd_url}\n'
-                        count += 1
-                        file.write(item_str)
-                print(f"Items exported: {count}")
+                file.writelines(lines)
+                print(f"Items exported: {len(lines)}")
                 print(f"\nContent list has been saved to {file_path}")
         except IOError as e:
             print(f"Error saving content list: {e}")
@@ -1563,25 +1680,32 @@ class ChannelList(QMainWindow):
     @staticmethod
     def save_stb_content(base_url, content_data, mac, file_path):
         try:
-            with open(file_path, "w", encoding="utf-8") as file:
+            with open(
+                file_path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE
+            ) as file:
                 file.write("#EXTM3U\n")
                 count = 0
+                # Build the play URL prefixes once for the whole export
+                play_prefixes = {
+                    "ch": f"{base_url}/play/live.php?mac={mac}&stream=",
+                    "vod": f"{base_url}/play/vod.php?mac={mac}&stream=",
+                }
                 for item in content_data:
                     name = item.get("name", "Unknown")
                     logo = item.get("logo", "")
                     xmltv_id = item.get("xmltv_id", "")
-                    cmd_url = item.get("cmd", "").replace("ffmpeg ", "")
+                    cmd_url = item.get("cmd", "").replace(FFMPEG_PREFIX, "")
 
                     # Generalized URL construction
                     if "localhost" in cmd_url:
-                        id_match = re.search(r"/(ch|vod)/(\d+)_", cmd_url)
+                        id_match = CONTENT_ID_RE.search(cmd_url)
                         if id_match:
-                            content_type = id_match.group(1)
-                            content_id = id_match.group(2)
-                            if content_type == "ch":
-                                cmd_url = f"{base_url}/play/live.php?mac={mac}&stream={content_id}&extension=m3u8"
-                            elif content_type == "vod":
-                                cmd_url = f"{base_url}/play/vod.php?mac={mac}&stream={content_id}&extension=m3u8"
+                            content_type, content_id = id_match.groups()
+                            cmd_url = (
+                                play_prefixes[content_type]
+                                + content_id
+                                + "&extension=m3u8"
+                            )
 
                     item_str = f'#EXTINF:-1 tvg-id="{xmltv_id}" tvg-logo="{logo}" ,{name}\n{cmd_url}\n'
                     count += 1
@@ -1594,6 +1718,10 @@ class ChannelList(QMainWindow):
     def save_config(self):
         self.config_manager.save_config()
 
+    def schedule_save_config(self):
+        # (Re)start the timer so that bursts of changes result in a single write
+        self.save_config_timer.start()
+
     def save_provider(self):
         self.provider_manager.save_provider()
 
@@ -1644,7 +1772,7 @@ class ChannelList(QMainWindow):
     def load_m3u_playlist(self, url):
         try:
             if url.startswith(("http://", "https://")):
-                response = requests.get(url)
+                response = self.provider_manager.session.get(url)
                 content = response.text
             else:
                 with open(url, "r", encoding="utf-8") as file:
@@ -1779,11 +1907,11 @@ class ChannelList(QMainWindow):
         id_counter = 0
         for line in lines:
             if line.startswith("#EXTINF"):
-                tvg_id_match = re.search(r'tvg-id="([^"]+)"', line)
-                tvg_logo_match = re.search(r'tvg-logo="([^"]+)"', line)
-                group_title_match = re.search(r'group-title="([^"]+)"', line)
-                user_agent_match = re.search(r'user-agent="([^"]+)"', line)
-                item_name_match = re.search(r",([^,]+)$", line)
+                tvg_id_match = TVG_ID_RE.search(line)
+                tvg_logo_match = TVG_LOGO_RE.search(line)
+                group_title_match = GROUP_TITLE_RE.search(line)
+                user_agent_match = USER_AGENT_RE.search(line)
+                item_name_match = ITEM_NAME_RE.search(line)
 
                 tvg_id = tvg_id_match.group(1) if tvg_id_match else None
                 tvg_logo = tvg_logo_match.group(1) if tvg_logo_match else None
@@ -1812,39 +1940,50 @@ class ChannelList(QMainWindow):
         return result
 
     def load_stb_categories(self, url, headers):
+        # Fetch and sort off the UI thread, the channel list can be large
+        self.lock_ui_before_loading()
+        self.progress_bar.setRange(0, 0)  # busy indicator
+        self.stb_categories_thread = StbCategoriesThread(
+            self, url, headers, self.content_type
+        )
+        self.stb_categories_thread.categories_loaded.connect(
+            self.update_stb_categories
+        )
+        self.stb_categories_thread.finished.connect(self.stb_categories_finished)
+        self.stb_categories_thread.start()
+        self.cancel_button.setText("Cancel loading categories")
+
+    def fetch_stb_categories(self, url, headers, content_type):
         url = URLObject(url)
         url = f"{url.scheme}://{url.netloc}"
         try:
             fetchurl = (
-                f"{url}/server/load.php?{self.get_categories_params(self.content_type)}"
+                f"{url}/server/load.php?{self.get_categories_params(content_type)}"
             )
-            response = requests.get(fetchurl, headers=headers)
-            result = response.json()
+            response = self.provider_manager.categories_session.get(
+                fetchurl, headers=headers, timeout=(3, 10)
+            )
+            result = json.loads(response.content)
             categories = result["js"]
             if not categories:
                 print("No categories found.")
-                return
-            # Save categories in config
-            provider_content = (
-                self.provider_manager.current_provider_content.setdefault(
-                    self.content_type, {}
-                )
-            )
-            provider_content["categories"] = categories
-            provider_content["contents"] = {}
+                return None
+            provider_content = {"categories": categories, "contents": {}}
 
             # Sorting all channels now by category
-            if self.content_type == "itv":
+            if content_type == "itv":
                 fetchurl = f"{url}/server/load.php?{self.get_allchannels_params()}"
-                response = requests.get(fetchurl, headers=headers)
-                result = response.json()
-                provider_content["contents"] = result["js"]["data"]
+                response = self.provider_manager.categories_session.get(
+                    fetchurl, headers=headers, timeout=(3, 10)
+                )
+                result = json.loads(response.content)
+                contents = provider_content["contents"] = result["js"]["data"]
 
                 # Split channels by category, and sort them number-wise
                 sorted_channels = {}
 
-                for i in range(len(provider_content["contents"])):
-                    genre_id = provider_content["contents"][i]["tv_genre_id"]
+                for i in range(len(contents)):
+                    genre_id = contents[i]["tv_genre_id"]
                     category = str(genre_id)
                     if category not in sorted_channels:
                         sorted_channels[category] = []
@@ -1852,7 +1991,7 @@ class ChannelList(QMainWindow):
 
                 for category in sorted_channels:
                     sorted_channels[category].sort(
-                        key=lambda x: int(provider_content["contents"][x]["number"])
+                        key=lambda x: int(contents[x]["number"])
                     )
 
                 # Add a specific category for null genre_id
@@ -1861,10 +2000,44 @@ class ChannelList(QMainWindow):
 
                 provider_content["sorted_channels"] = sorted_channels
 
-            self.save_provider()
-            self.display_categories(categories)
+            return provider_content
         except Exception as e:
             print(f"Error loading STB categories: {e}")
+            return None
+
+    def update_stb_categories(self, provider_content):
+        # Drop the result of a fetch that was cancelled
+        if self.sender() is not getattr(self, "stb_categories_thread", None):
+            return
+        # Save categories in config
+        self.provider_manager.current_provider_content.setdefault(
+            self.content_type, {}
+        ).update(provider_content)
+        self.save_provider()
+        self.display_categories(provider_content["categories"])
+
+    def stb_categories_finished(self):
+        if self.sender() is not getattr(self, "stb_categories_thread", None):
+            return
+        self.progress_bar.setRange(0, 100)  # Stop busy indicator
+        self.stb_categories_thread.deleteLater()
+        del self.stb_categories_thread
+        self.unlock_ui_after_loading()
+
+    def cancel_stb_categories(self):
+        # The request cannot be interrupted, let it end in the background.
+        # Qt takes ownership of the thread and deletes it once it is done.
+        thread = self.stb_categories_thread
+        del self.stb_categories_thread
+        thread.categories_loaded.disconnect()
+        thread.finished.disconnect()
+        if thread.isFinished():
+            thread.deleteLater()
+        else:
+            thread.setParent(self)
+            thread.finished.connect(thread.deleteLater)
+        self.progress_bar.setRange(0, 100)  # Stop busy indicator
+        self.unlock_ui_after_loading()
 
     @staticmethod
     def get_categories_params(_type):
@@ -1892,18 +2065,19 @@ class ChannelList(QMainWindow):
 
         if self.content_type == "itv":
             # Show only channels for the selected category
+            contents = content_data["contents"]
             if category_id == "*":
-                items = content_data["contents"]
+                items = contents
             else:
                 items = [
-                    content_data["contents"][i]
+                    contents[i]
                     for i in content_data["sorted_channels"].get(category_id, [])
                 ]
             self.display_content(items, content="channel")
         else:
             # Check if we have cached content for this category
-            if category_id in content_data.get("contents", {}):
-                items = content_data["contents"][category_id]
+            items = content_data.get("contents", {}).get(category_id)
+            if items is not None:
                 if self.content_type == "itv":
                     self.display_content(
                         items, content="channel", select_first=select_first
@@ -1955,45 +2129,39 @@ class ChannelList(QMainWindow):
         self.cancel_button.setText("Cancel loading content in category")
 
     def load_series_seasons(self, series_item, select_first=True):
-        selected_provider = self.provider_manager.current_provider
-        headers = self.provider_manager.headers
-        url = selected_provider.get("url", "")
-        url = URLObject(url)
-        url = f"{url.scheme}://{url.netloc}/server/load.php"
-
         self.current_series = series_item  # Store current series
 
-        self.lock_ui_before_loading()
-        if hasattr(self, "content_loader") and self.content_loader.isRunning():
-            self.content_loader.wait()
-        self.content_loader = ContentLoader(
-            url=url,
-            headers=headers,
-            content_type="series",
+        self.load_series_content(
             category_id=series_item["category_id"],
-            movie_id=series_item["id"],  # series ID
+            series_id=series_item["id"],
             season_id=0,
-            action="get_ordered_list",
             sortby="name",
+            on_loaded=lambda data: self.update_seasons_list(data, select_first),
+            cancel_text="Cancel loading seasons",
         )
 
-        self.content_loader.content_loaded.connect(
-            lambda data: self.update_seasons_list(data, select_first)
+    def load_season_episodes(self, season_item, select_first=True):
+        self.current_season = season_item  # Store current season
+
+        self.load_series_content(
+            category_id=self.current_category["id"],
+            series_id=self.current_series["id"],
+            season_id=season_item["id"],
+            sortby="added",
+            on_loaded=lambda data: self.update_episodes_list(data, select_first),
+            cancel_text="Cancel loading episodes",
         )
-        self.content_loader.progress_updated.connect(self.update_progress)
-        self.content_loader.finished.connect(self.content_loader_finished)
-        self.content_loader.start()
-        self.cancel_button.setText("Cancel loading seasons")
 
-    def load_season_episodes(self, season_item, select_first=True):
+    def load_series_content(
+        self, category_id, series_id, season_id, sortby, on_loaded, cancel_text
+    ):
+        # Shared loader for series seasons (season_id=0) and season episodes
         selected_provider = self.provider_manager.current_provider
         headers = self.provider_manager.headers
         url = selected_provider.get("url", "")
         url = URLObject(url)
         url = f"{url.scheme}://{url.netloc}/server/load.php"
 
-        self.current_season = season_item  # Store current season
-
         self.lock_ui_before_loading()
         if hasattr(self, "content_loader") and self.content_loader.isRunning():
             self.content_loader.wait()
@@ -2001,33 +2169,51 @@ class ChannelList(QMainWindow):
             url=url,
             headers=headers,
             content_type="series",
-            category_id=self.current_category["id"],  # Category ID
-            movie_id=self.current_series["id"],  # Series ID
-            season_id=season_item["id"],  # Season ID
+            category_id=category_id,
+            movie_id=series_id,
+            season_id=season_id,
             action="get_ordered_list",
-            sortby="added",
-        )
-        self.content_loader.content_loaded.connect(
-            lambda data: self.update_episodes_list(data, select_first)
+            sortby=sortby,
         )
+        self.content_loader.content_loaded.connect(on_loaded)
         self.content_loader.progress_updated.connect(self.update_progress)
         self.content_loader.finished.connect(self.content_loader_finished)
         self.content_loader.start()
-        self.cancel_button.setText("Cancel loading episodes")
+        self.cancel_button.setText(cancel_text)
 
     def play_item(self, item_data, is_episode=False):
+        if hasattr(self, "link_thread"):
+            # A newer click wins, drop the result of the pending request
+            self.link_thread.link_created.disconnect(self.play_created_link)
+            del self.link_thread
         if self.provider_manager.current_provider["type"] == "STB":
-            url = self.create_link(item_data, is_episode=is_episode)
-            if url:
-                self.link = url
-                self.player.play_video(url)
-            else:
-                print("Failed to create link.")
+            # Ask the portal for the link off the UI thread
+            link_thread = LinkCreatorThread(self, item_data, is_episode=is_episode)
+            link_thread.link_created.connect(self.play_created_link)
+            link_thread.finished.connect(link_thread.deleteLater)
+            self.link_thread = link_thread
+            link_thread.start()
         else:
             cmd = item_data.get("cmd")
             self.link = cmd
             self.player.play_video(cmd)
 
+    def play_created_link(self, url):
+        # A result already queued when a newer click replaced its thread
+        # still arrives after the disconnect, ignore it
+        if self.sender() is not getattr(self, "link_thread", None):
+            return
+        del self.link_thread
+        if url:
+            self.link = url
+            self.player.play_video(url)
+        else:
+            QMessageBox.warning(
+                self,
+                "Playback Error",
+                "Failed to create a stream link for this item.",
+            )
+
     def cancel_loading(self):
         if hasattr(self, "content_loader") and self.content_loader.isRunning():
             self.content_loader.terminate()
@@ -2037,6 +2223,11 @@ class ChannelList(QMainWindow):
             QMessageBox.information(
                 self, "Cancelled", "Content loading has been cancelled."
             )
+        elif hasattr(self, "stb_categories_thread"):
+            self.cancel_stb_categories()
+            QMessageBox.information(
+                self, "Cancelled", "Category loading has been cancelled."
+            )
         elif hasattr(self, "image_loader") and self.image_loader.isRunning():
             self.image_loader.terminate()
             if hasattr(self, "image_loader"):
@@ -2046,6 +2237,13 @@ class ChannelList(QMainWindow):
             QMessageBox.information(
                 self, "Cancelled", "Image loading has been cancelled."
             )
+        elif hasattr(self, "image_loader"):
+            # Still waiting for a cancelled loader to stop, never start it
+            self.cancel_image_loader()
+            self.unlock_ui_after_loading()
+            QMessageBox.information(
+                self, "Cancelled", "Image loading has been cancelled."
+            )
 
     def lock_ui_before_loading(self):
         self.update_ui_on_loading(loading=True)
@@ -2074,6 +2272,36 @@ class ChannelList(QMainWindow):
             del self.content_loader
         self.unlock_ui_after_loading()
 
+    def cancel_image_loader(self):
+        # Ask a running loader to stop without blocking the UI thread.
+        # Qt takes ownership of it and deletes it once its thread is done.
+        if not hasattr(self, "image_loader"):
+            return
+        loader = self.image_loader
+        del self.image_loader
+        loader.progress_updated.disconnect()
+        loader.finished.disconnect()
+        if loader.isRunning():
+            loader.setParent(self)
+            loader.finished.connect(loader.deleteLater)
+            loader.finished.connect(self.image_loader_stopped)
+            loader.request_cancel()
+            self.stopping_image_loader = loader
+        else:
+            # Not started yet, or done with its finished signal still queued
+            loader.deleteLater()
+
+    def start_image_loader(self):
+        # ImageManager's cache is not thread safe, so a new loader waits
+        # until the cancelled one has left its thread
+        if self.stopping_image_loader is None:
+            self.image_loader.start()
+
+    def image_loader_stopped(self):
+        self.stopping_image_loader = None
+        if hasattr(self, "image_loader"):
+            self.image_loader.start()
+
     def image_loader_finished(self):
         if hasattr(self, "image_loader"):
             self.image_loader.deleteLater()
@@ -2100,30 +2328,32 @@ class ChannelList(QMainWindow):
 
     def update_seasons_list(self, data, select_first=True):
         items = data.get("items")
+        series_name = self.current_series["name"]
         for item in items:
             item["number"] = item["name"].split(" ")[-1]
-            item["name"] = f'{self.current_series["name"]}.{item["name"]}'
+            item["name"] = f'{series_name}.{item["name"]}'
         self.display_content(items, content="season", select_first=select_first)
 
     def update_episodes_list(self, data, select_first=True):
-        items = data.get("items")
-        selected_season = None
-        for item in items:
-            if item.get("id") == data.get("season_id"):
-                selected_season = item
-                break
+        season_id = data.get("season_id")
+        selected_season = next(
+            (item for item in data.get("items") if item.get("id") == season_id), None
+        )
 
         if selected_season:
-            episodes = selected_season.get("series", [])
-            episode_items = []
-            for episode_num in episodes:
-                # merge episode data with series data
-                episode_item = self.current_series.copy()
-                episode_item["number"] = f"{episode_num}"
-                episode_item["ename"] = f"Episode {episode_num}"
-                episode_item["cmd"] = selected_season.get("cmd")
-                episode_item["series"] = episode_num
-                episode_items.append(episode_item)
+            # merge episode data with series data, the season fields are shared by all episodes
+            series = self.current_series
+            cmd = selected_season.get("cmd")
+            episode_items = [
+                {
+                    **series,
+                    "number": f"{episode_num}",
+                    "ename": f"Episode {episode_num}",
+                    "cmd": cmd,
+                    "series": episode_num,
+                }
+                for episode_num in selected_season.get("series", [])
+            ]
             self.display_content(
                 episode_items, content="episode", select_first=select_first
             )
@@ -2132,7 +2362,7 @@ class ChannelList(QMainWindow):
 
     def update_progress(self, current, total):
         if total:
-            progress_percentage = int((current / total) * 100)
+            progress_percentage = current * 100 // total
             self.progress_bar.setValue(progress_percentage)
             if progress_percentage == 100:
                 self.progress_bar.setVisible(False)
@@ -2146,33 +2376,32 @@ class ChannelList(QMainWindow):
         try:
             selected_provider = self.provider_manager.current_provider
             headers = self.provider_manager.headers
-            url = selected_provider.get("url", "")
-            url = URLObject(url)
-            url = f"{url.scheme}://{url.netloc}"
+            parts = urlsplit(selected_provider.get("url", ""))
+            url = f"{parts.scheme}://{parts.netloc}"
             cmd = item.get("cmd")
             if is_episode:
                 # For episodes, we need to pass 'series' parameter
-                series_param = item.get("series")  # This should be the episode number
-                fetchurl = (
-                    f"{url}/server/load.php?type={'vod' if self.content_type == 'series' else self.content_type}&action=create_link"
-                    f"&cmd={requests.utils.quote(cmd)}&series={series_param}&JsHttpRequest=1-xml"
+                fetchurl = CREATE_LINK_EPISODE_URL.format(
+                    base=url,
+                    type="vod" if self.content_type == "series" else self.content_type,
+                    cmd=requests.utils.quote(cmd),
+                    series=item.get("series"),  # This should be the episode number
                 )
             else:
-                fetchurl = (
-                    f"{url}/server/load.php?type={self.content_type}&action=create_link"
-                    f"&cmd={requests.utils.quote(cmd)}&JsHttpRequest=1-xml"
+                fetchurl = CREATE_LINK_URL.format(
+                    base=url, type=self.content_type, cmd=requests.utils.quote(cmd)
                 )
-            response = requests.get(fetchurl, headers=headers)
+            response = self.provider_manager.session.get(
+                fetchurl, headers=headers, timeout=5
+            )
             if response.status_code != 200 or not response.content:
                 print(
                     f"Error creating link: status code {response.status_code}, response content empty"
                 )
                 return None
-            result = response.json()
+            result = json.loads(response.content)
             link = result["js"]["cmd"].split(" ")[-1]
-            link = self.sanitize_url(link)
-            self.link = link
-            return link
+            return self.sanitize_url(link)
         except Exception as e:
             print(f"Error creating link: {e}")
             return None
@@ -23,6 +23,7 @@ class ConfigManager:
 
     def __init__(self):
         self.config = {}
+        self.favorites_set = set()
         self.config_path = self._get_config_path()
         self._migrate_old_config()
         self.load_config()
@@ -70,6 +71,9 @@ class ConfigManager:
 
         self.update_patcher()
 
+        # Keep a set of favorites for constant-time membership checks
+        self.favorites_set = set(self.favorites)
+
     def update_patcher(self):
 
         need_update = False
@@ -153,6 +157,18 @@ class ConfigManager:
     @favorites.setter
     def favorites(self, value):
         self.config["favorites"] = value
+        self.favorites_set = set(value)
+
+    def toggle_favorite(self, item_name):
+        # Add or remove item from favorites, return True if it is now a favorite
+        favorites = self.favorites
+        if item_name in self.favorites_set:
+            self.favorites_set.remove(item_name)
+            favorites.remove(item_name)
+            return False
+        self.favorites_set.add(item_name)
+        favorites.append(item_name)
+        return True
 
     @property
     def show_stb_content_info(self):
@@ -160,7 +160,7 @@ class ContentLoader(QThread):
             # Fetch initial data to get total items and max page items
             page = 1
             page_items, total_items, max_page_items = await self.fetch_page(
-                session, page, self.timeout
+                session, page, self.max_retries, self.timeout
             )
             # if page_items is list, extend items
             if isinstance(page_items, list):
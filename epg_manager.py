@@ -161,7 +161,11 @@ class EpgManager:
                     epg_date = datetime.strptime(epg_info["date"], "%Y-%m-%d %H:%M:%S")
                     # Request the URL with "If-Modified-Since" header
                     headers = {"If-Modified-Since": epg_date.strftime("%a, %d %b %Y %H:%M:%S GMT")}
-                    r = requests.get(url, headers=headers)
+                    try:
+                        r = self.provider_manager.session.get(url, headers=headers, timeout=(5, 30))
+                    except requests.RequestException as e:
+                        print(f"Error checking EPG URL: {e}")
+                        return False
                     if r.status_code == 304:
                         # EPG is still fresh
                         self.index[url_hash]["last_access"] = current_time.strftime("%Y-%m-%d %H:%M:%S")
@@ -299,7 +303,11 @@ class EpgManager:
         self.save_index()
 
     def _fetch_epg_from_url(self, url):
-        r = requests.get(url, stream = True)
+        try:
+            r = self.provider_manager.session.get(url, stream=True, timeout=(5, 30))
+        except requests.RequestException as e:
+            print(f"Error fetching EPG URL: {e}")
+            return
         if r.status_code == 200:
             content_type = r.headers.get("Content-Type", "")
             xmltv_file_path = None
@@ -56,6 +56,10 @@ class ImageLoader(QThread):
             image_count = len(tasks)
 
             for i, task in enumerate(asyncio.as_completed(tasks), 1):
+                # Stop as soon as a newer loader took over, pending tasks are
+                # cancelled when the event loop shuts down
+                if self.isInterruptionRequested():
+                    break
                 try:
                     image_item = await task
                 except Exception as e:
@@ -64,6 +68,9 @@ class ImageLoader(QThread):
                 finally:
                     self.progress_updated.emit(i, image_count, image_item)
 
+    def request_cancel(self):
+        self.requestInterruption()
+
     def run(self):
         try:
             asyncio.run(self.load_images())
@@ -1,7 +1,6 @@
 import asyncio
 import os
 import hashlib
-import json
 import orjson
 import base64
 import random
@@ -200,10 +199,11 @@ class ImageManager:
     def _load_index(self):
         self.cache.clear()
         if os.path.exists(self.index_file):
-            with open(self.index_file, 'r') as f:
+            with open(self.index_file, 'rb') as f:
                 try:
-                    self.cache = json.load(f, object_pairs_hook=OrderedDict)
-                except (json.JSONDecodeError, IOError) as e:
+                    # orjson keeps the file's key order, which is the access order
+                    self.cache = OrderedDict(orjson.loads(f.read()))
+                except (orjson.JSONDecodeError, IOError) as e:
                     print(f"Error loading index file: {e}")
 
         # Add missing keys to the cache
@@ -1,6 +1,12 @@
+_MISSING = object()  # Sentinel for lookups where None is a valid value
+
+
 class MultiKeyDict:
+    __slots__ = ("_data", "_keys_map")
+
     def __init__(self):
         self._data = {}
+        # Every alias maps to its (keys, value) entry, so reads take a single lookup
         self._keys_map = {}
 
     def __len__(self):
@@ -9,22 +15,27 @@ class MultiKeyDict:
     def __setitem__(self, keys, value):
         if not isinstance(keys, tuple):
             keys = (keys,)
+        entry = (keys, value)
+        keys_map = self._keys_map
         for key in keys:
-            self._keys_map[key] = keys
+            keys_map[key] = entry
         self._data[keys] = value
 
     def __getitem__(self, key):
-        keys = self._keys_map.get(key)
-        if keys is None:
+        entry = self._keys_map.get(key)
+        if entry is None:
             raise KeyError(key)
-        return self._data[keys]
+        return entry[1]
 
     def __delitem__(self, key):
-        keys = self._keys_map.get(key)
-        if keys is None:
+        keys_map = self._keys_map
+        entry = keys_map.pop(key, _MISSING)
+        if entry is _MISSING:
             raise KeyError(key)
+        keys = entry[0]
         for k in keys:
-            del self._keys_map[k]
+            if k != key:
+                del keys_map[k]
         del self._data[keys]
 
     def __contains__(self, key):
@@ -33,43 +44,65 @@ class MultiKeyDict:
     def __repr__(self):
         return f"{self.__class__.__name__}({self._data})"
 
+    def __getstate__(self):
+        # Only the key groups are pickled, the alias map is rebuilt on load
+        return {"_data": self._data}
+
+    def __setstate__(self, state):
+        # Also restores pickles that still carry the old keys-only alias map
+        self._data = state["_data"]
+        self._keys_map = {
+            key: (keys, value) for keys, value in self._data.items() for key in keys
+        }
+
     def items(self):
         return self._data.items()
 
     def get(self, key, default=None):
-        keys = self._keys_map.get(key)
-        if keys is None:
+        entry = self._keys_map.get(key)
+        if entry is None:
             return default
-        return self._data[keys]
+        return entry[1]
 
     def get_keys(self, key, default=None):
-        keys = self._keys_map.get(key)
-        if keys is None:
+        entry = self._keys_map.get(key)
+        if entry is None:
             return default
-        return keys
+        return entry[0]
 
     def pop(self, key, default=None):
-        if key in self:
-            value = self[key]
-            del self[key]
-            return value
-        return default
+        keys_map = self._keys_map
+        entry = keys_map.pop(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        keys = entry[0]
+        for k in keys:
+            if k != key:
+                keys_map.pop(k, None)
+        return self._data.pop(keys)
 
     def setdefault(self, keys, default=None):
         if not isinstance(keys, tuple):
             keys = (keys,)
-        if keys in self._data:
-            return self._data[keys]
-        self[keys] = default
+        value = self._data.get(keys, _MISSING)
+        if value is not _MISSING:
+            return value
+        # Miss, register the aliases without going through __setitem__ again
+        self._data[keys] = default
+        entry = (keys, default)
+        keys_map = self._keys_map
+        for key in keys:
+            keys_map[key] = entry
         return default
 
     def serialize(self):
-        return [list(keys) + [value] for keys, value in self._data.items()]
+        return [[*keys, value] for keys, value in self._data.items()]
 
     @classmethod
     def deserialize(cls, serialized_data):
+        # Build both maps in bulk instead of calling __setitem__ per row
         multi_key_dict = cls()
-        for item in serialized_data:
-            *keys, value = item
-            multi_key_dict[tuple(keys)] = value
-        return multi_key_dict
\ No newline at end of file
+        multi_key_dict.__setstate__(
+            {"_data": {tuple(item[:-1]): item[-1] for item in serialized_data}}
+        )
+        return multi_key_dict
@@ -4,7 +4,7 @@ from config_manager import MultiKeyDict
 import orjson as json
 import requests
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QButtonGroup,
@@ -20,6 +20,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QRadioButton,
+    QSizePolicy,
     QSpinBox,
     QTabWidget,
     QTableWidget,
@@ -28,6 +29,31 @@ from PySide6.QtWidgets import (
     QWidget
 )
 
+# Provider types, indexed by the id of their radio button in the type group
+STREAM_TYPES = ("STB", "M3UPLAYLIST", "M3USTREAM", "XTREAM")
+
+
+class VerifyProviderThread(QThread):
+    verified = Signal(bool)
+
+    def __init__(self, options_dialog, provider_type, url, mac):
+        # Owned by the main window so a closed dialog does not destroy it mid-check
+        super().__init__(options_dialog.channel_list)
+        self.options_dialog = options_dialog
+        self.provider_type = provider_type
+        self.url = url
+        self.mac = mac
+
+    def run(self):
+        try:
+            result = self.options_dialog.check_provider(
+                self.provider_type, self.url, self.mac
+            )
+        except Exception as e:
+            print(f"Error verifying provider: {e}")
+            result = False
+        self.verified.emit(bool(result))
+
 
 class AddXmltvMappingDialog(QDialog):
     def __init__(self, parent=None, channel_name="", logo_url="", channel_ids=""):
@@ -72,24 +98,31 @@ class OptionsDialog(QDialog):
 
         self.setWindowTitle("Settings")
 
+        self.channel_list = parent
         self.config_manager = parent.config_manager
         self.provider_manager = parent.provider_manager
         self.epg_manager = parent.epg_manager
         self.providers = self.provider_manager.providers
         self.selected_provider_name = self.config_manager.selected_provider_name
-        self.selected_provider_index = 0
+        self.selected_provider_index = next(
+            (
+                i
+                for i, provider in enumerate(self.providers)
+                if provider["name"] == self.selected_provider_name
+            ),
+            0,
+        )
+        self.edited_provider = None
+        self.display_names = {}
         self.epg_settings_modified = False
         self.xmltv_mapping_modified = False
         self.providers_modified = False
         self.current_provider_changed = False
 
-        for i in range(len(self.providers)):
-            if self.providers[i]["name"] == self.config_manager.selected_provider_name:
-                self.selected_provider_index = i
-                break
-
         self.main_layout = QVBoxLayout(self);
 
+        # Build and fill every tab before letting Qt process any update
+        self.setUpdatesEnabled(False)
         self.create_options_ui()
 
         self.save_button = QPushButton("Save", self)
@@ -99,6 +132,7 @@ class OptionsDialog(QDialog):
         self.main_layout.addWidget(self.save_button)
 
         self.load_providers()
+        self.setUpdatesEnabled(True)
 
     def create_options_ui(self):
         self.options_tab = QTabWidget(self)
@@ -109,35 +143,51 @@ class OptionsDialog(QDialog):
         # Add tab with providers
         self.create_providers_ui()
 
-        # Add tab with EPG settings
-        self.create_epg_ui()
+        # Add tab with EPG settings, its content is built when first shown
+        self.epg_tab = QWidget(self)
+        self.epg_layout = None
+        self.options_tab.addTab(self.epg_tab, "EPG")
+        self.options_tab.currentChanged.connect(self.on_tab_changed)
+
+    def on_tab_changed(self, index):
+        if self.epg_layout is None and self.options_tab.widget(index) is self.epg_tab:
+            self.epg_tab.setUpdatesEnabled(False)
+            try:
+                self.create_epg_ui()
+            finally:
+                self.epg_tab.setUpdatesEnabled(True)
+            # Toggles the tab's updates itself, so only once the build is done
+            self.on_epg_source_changed()
 
     def create_settings_ui(self):
         self.settings_tab = QWidget(self)
         self.options_tab.addTab(self.settings_tab, "Settings")
-        self.settings_layout = QFormLayout(self.settings_tab)
+        self.settings_layout = QVBoxLayout(self.settings_tab)
 
         # Add check button to allow checking for updates
         self.check_updates_checkbox = QCheckBox("Allow Check for Updates", self.settings_tab)
         self.check_updates_checkbox.setChecked(self.config_manager.check_updates)
         self.check_updates_checkbox.stateChanged.connect(self.on_check_updates_toggled)
-        self.settings_layout.addRow(self.check_updates_checkbox)
+        self.settings_layout.addWidget(self.check_updates_checkbox)
 
         # Add check button to enable channel logos
         self.channel_logos_checkbox = QCheckBox("Enable Channel Logos", self.settings_tab)
         self.channel_logos_checkbox.setChecked(self.config_manager.channel_logos)
-        self.settings_layout.addRow(self.channel_logos_checkbox)
+        self.settings_layout.addWidget(self.channel_logos_checkbox)
 
         # Add cache options
-        self.cache_options_layout = QVBoxLayout()
+        self.cache_options_layout = QHBoxLayout()
         self.cache_image_size_label = QLabel(f"Max size of image cache (actual size: {self.get_cache_image_size():.2f} MB)", self.settings_tab)
         self.cache_image_size_input = QLineEdit(self.settings_tab)
         self.cache_image_size_input.setText(str(self.config_manager.max_cache_image_size))
-        self.settings_layout.addRow(self.cache_image_size_label, self.cache_image_size_input)
+        self.cache_options_layout.addWidget(self.cache_image_size_label)
+        self.cache_options_layout.addWidget(self.cache_image_size_input)
+        self.settings_layout.addLayout(self.cache_options_layout)
 
         self.clear_image_cache_button = QPushButton("Clear Image Cache", self.settings_tab)
         self.clear_image_cache_button.clicked.connect(self.clear_image_cache)
-        self.settings_layout.addRow(self.clear_image_cache_button)
+        self.settings_layout.addWidget(self.clear_image_cache_button)
+        self.settings_layout.addStretch()
 
     def create_providers_ui(self):
         self.providers_tab = QWidget(self)
@@ -146,6 +196,12 @@ class OptionsDialog(QDialog):
 
         self.provider_label = QLabel("Select Provider:", self.providers_tab)
         self.provider_combo = QComboBox(self.providers_tab)
+        # Size from a fixed length, not by measuring every provider name
+        self.provider_combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        # Room for "N: " plus a name truncated to 48 characters, even where the
+        # form keeps fields at their size hint (macOS)
+        self.provider_combo.setMinimumContentsLength(50)
+        self.provider_combo.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.provider_combo.currentIndexChanged.connect(self.load_provider_settings)
         self.providers_layout.addRow(self.provider_label, self.provider_combo)
 
@@ -202,15 +258,18 @@ class OptionsDialog(QDialog):
         self.type_M3UPLAYLIST = QRadioButton("M3U Playlist", self)
         self.type_M3USTREAM = QRadioButton("M3U Stream", self)
         self.type_XTREAM = QRadioButton("Xtream", self)
-        self.type_group.addButton(self.type_STB)
-        self.type_group.addButton(self.type_M3UPLAYLIST)
-        self.type_group.addButton(self.type_M3USTREAM)
-        self.type_group.addButton(self.type_XTREAM)
-
-        self.type_STB.toggled.connect(self.update_inputs)
-        self.type_M3UPLAYLIST.toggled.connect(self.update_inputs)
-        self.type_M3USTREAM.toggled.connect(self.update_inputs)
-        self.type_XTREAM.toggled.connect(self.update_inputs)
+        # Provider type stored in the config for each radio button
+        self.type_buttons = {
+            "STB": self.type_STB,
+            "M3UPLAYLIST": self.type_M3UPLAYLIST,
+            "M3USTREAM": self.type_M3USTREAM,
+            "XTREAM": self.type_XTREAM,
+        }
+        for type_id, provider_type in enumerate(STREAM_TYPES):
+            self.type_group.addButton(self.type_buttons[provider_type], type_id)
+
+        # One notification per switch, the group also reports the unchecked button
+        self.type_group.idToggled.connect(self.on_type_toggled)
 
         grid_layout = QGridLayout()
         grid_layout.addWidget(self.type_STB, 0, 0)
@@ -220,8 +279,6 @@ class OptionsDialog(QDialog):
         self.providers_layout.addRow(self.type_label, grid_layout)
 
     def create_epg_ui(self):
-        self.epg_tab = QWidget(self)
-        self.options_tab.addTab(self.epg_tab, "EPG")
         self.epg_layout = QFormLayout(self.epg_tab)
 
         # Add EPG settings
@@ -311,108 +368,139 @@ class OptionsDialog(QDialog):
 
         self.epg_layout.addRow(self.xmltv_group_widget)
 
-        # Initial call to set visibility based on the current selection
-        self.on_epg_source_changed()
-
     def load_providers(self):
         self.provider_combo.blockSignals(True)
         self.provider_combo.clear()
+        # Insert all rows at once, then attach each provider as its row's data
+        self.provider_combo.addItems(
+            [
+                self.provider_display_name(i, provider)
+                for i, provider in enumerate(self.providers)
+            ]
+        )
         for i, provider in enumerate(self.providers):
-            # can we get the first couple ... last couple of characters of the name?
-            prov = (
-                provider["name"][:30] + "..." + provider["name"][-15:]
-                if len(provider["name"]) > 45
-                else provider["name"]
-            )
-            self.provider_combo.addItem(f"{i + 1}: {prov}", userData=provider)
+            self.provider_combo.setItemData(i, provider)
         self.provider_combo.blockSignals(False)
         self.provider_combo.setCurrentIndex(self.selected_provider_index)
         self.load_provider_settings(self.selected_provider_index)
 
+    def provider_display_name(self, index, provider):
+        name = provider["name"]
+        # Keyed by provider, the stored name tells whether the entry is still valid
+        cached = self.display_names.get(id(provider))
+        if cached is not None and cached[0] == name:
+            short_name = cached[1]
+        else:
+            # can we get the first couple ... last couple of characters of the name?
+            short_name = name[:30] + "..." + name[-15:] if len(name) > 45 else name
+            self.display_names[id(provider)] = (name, short_name)
+        return f"{index + 1}: {short_name}"
+
     def load_provider_settings(self, index):
         if index == -1 or index >= len(self.providers):
             return
+        if self.providers[index] is self.edited_provider:
+            # Already shown, e.g. the combo signal and an explicit load for the same row
+            return
         self.selected_provider_name = self.providers[index].get("name", self.providers[index].get("url", ""))
         self.selected_provider_index = index
         self.edited_provider = self.providers[index]
-        self.name_input.setText(self.edited_provider.get("name", ""))
-        self.url_input.setText(self.edited_provider.get("url", ""))
-        self.mac_input.setText(self.edited_provider.get("mac", ""))
-        self.username_input.setText(self.edited_provider.get("username", ""))
-        self.password_input.setText(self.edited_provider.get("password", ""))
+        self.set_input_text(self.name_input, self.edited_provider.get("name", ""))
+        self.set_input_text(self.url_input, self.edited_provider.get("url", ""))
+        self.set_input_text(self.mac_input, self.edited_provider.get("mac", ""))
+        self.set_input_text(self.username_input, self.edited_provider.get("username", ""))
+        self.set_input_text(self.password_input, self.edited_provider.get("password", ""))
         self.update_radio_buttons()
         self.update_inputs()
 
+    @staticmethod
+    def set_input_text(line_edit, text):
+        # Leave an input that already holds the value alone (cursor, undo history)
+        if line_edit.text() != text:
+            line_edit.setText(text)
+
     def on_epg_source_changed(self):
         epg_source = self.epg_source_combo.currentText()
-
-        self.epg_url_label.hide()
-        self.epg_url_input.hide()
-        self.epg_expiration_label.hide()
-        self.epg_expiration_spinner.hide()
-        self.epg_expiration_combo.hide()
-        self.epg_file_label.hide()
-        self.epg_file_input.hide()
-        self.epg_file_button.hide()
-        self.xmltv_group_widget.hide()
-
-        if epg_source == "URL":
-            self.epg_url_label.show()
-            self.epg_url_input.show()
-
-        if epg_source == "Local File":
-            self.epg_file_label.show()
-            self.epg_file_input.show()
-            self.epg_file_button.show()
-        elif epg_source != "No Source":
-            self.epg_expiration_label.show()
-            self.epg_expiration_spinner.show()
-            self.epg_expiration_combo.show()
-
-        if epg_source not in ["STB", "No Source"]:
-            self.xmltv_group_widget.show()
+        show_url = epg_source == "URL"
+        show_file = epg_source == "Local File"
+        show_expiration = epg_source not in ["Local File", "No Source"]
+        show_xmltv = epg_source not in ["STB", "No Source"]
+
+        # Set each widget's visibility once and lay the tab out a single time
+        self.epg_tab.setUpdatesEnabled(False)
+        self.epg_url_label.setVisible(show_url)
+        self.epg_url_input.setVisible(show_url)
+        self.epg_file_label.setVisible(show_file)
+        self.epg_file_input.setVisible(show_file)
+        self.epg_file_button.setVisible(show_file)
+        self.epg_expiration_label.setVisible(show_expiration)
+        self.epg_expiration_spinner.setVisible(show_expiration)
+        self.epg_expiration_combo.setVisible(show_expiration)
+        self.xmltv_group_widget.setVisible(show_xmltv)
+        self.epg_tab.setUpdatesEnabled(True)
 
     def update_radio_buttons(self):
         provider_type = self.edited_provider.get("type", "")
-        self.type_STB.setChecked(provider_type == "STB")
-        self.type_M3UPLAYLIST.setChecked(provider_type == "M3UPLAYLIST")
-        self.type_M3USTREAM.setChecked(provider_type == "M3USTREAM")
-        self.type_XTREAM.setChecked(provider_type == "XTREAM")
+        # The caller refreshes the inputs once afterwards
+        self.type_group.blockSignals(True)
+        for button_type, button in self.type_buttons.items():
+            button.setChecked(provider_type == button_type)
+        self.type_group.blockSignals(False)
+
+    def on_type_toggled(self, type_id, checked):
+        if checked:
+            self.update_inputs()
+
+    def checked_provider_type(self):
+        type_id = self.type_group.checkedId()
+        return STREAM_TYPES[type_id] if type_id >= 0 else None
 
     def update_inputs(self):
-        self.mac_label.setVisible(self.type_STB.isChecked())
-        self.mac_input.setVisible(self.type_STB.isChecked())
-        self.file_button.setVisible(
-            self.type_M3UPLAYLIST.isChecked() or self.type_M3USTREAM.isChecked()
-        )
+        provider_type = self.checked_provider_type()
+        is_stb = provider_type == "STB"
+        is_xtream = provider_type == "XTREAM"
+        self.mac_label.setVisible(is_stb)
+        self.mac_input.setVisible(is_stb)
+        self.file_button.setVisible(provider_type in ("M3UPLAYLIST", "M3USTREAM"))
 
         self.url_input.setEnabled(True)
 
-        self.username_label.setVisible(self.type_XTREAM.isChecked())
-        self.username_input.setVisible(self.type_XTREAM.isChecked())
-        self.password_label.setVisible(self.type_XTREAM.isChecked())
-        self.password_input.setVisible(self.type_XTREAM.isChecked())
+        self.username_label.setVisible(is_xtream)
+        self.username_input.setVisible(is_xtream)
+        self.password_label.setVisible(is_xtream)
+        self.password_input.setVisible(is_xtream)
 
     def add_new_provider(self):
         new_provider = {"type": "STB", "name": "", "url": "", "mac": ""}
         self.providers.append(new_provider)
-        self.load_providers()
-        self.provider_combo.setCurrentIndex(len(self.providers) - 1)
+        index = len(self.providers) - 1
+        self.provider_combo.addItem(
+            self.provider_display_name(index, new_provider), userData=new_provider
+        )
+        self.provider_combo.setCurrentIndex(index)
         self.providers_modified = True
 
     def remove_provider(self):
         if len(self.providers) == 1:
             return
-        del self.providers[self.provider_combo.currentIndex()]
-        self.load_providers()
-        self.provider_combo.setCurrentIndex(
-            min(self.selected_provider_index, len(self.providers) - 1)
-        )
+        index = self.provider_combo.currentIndex()
+        removed_provider = self.providers.pop(index)
+        self.display_names.pop(id(removed_provider), None)
+        self.provider_combo.blockSignals(True)
+        self.provider_combo.removeItem(index)
+        # The rows below move up one place, renumber only those
+        for i in range(index, len(self.providers)):
+            self.provider_combo.setItemText(
+                i, self.provider_display_name(i, self.providers[i])
+            )
+        self.provider_combo.blockSignals(False)
+        index = min(index, len(self.providers) - 1)
+        self.provider_combo.setCurrentIndex(index)
+        self.load_provider_settings(index)
         self.providers_modified = True
 
     def browse_epg_file(self):
-        file_dialog = QFileDialog(self)
-        file_path, _ = file_dialog.getOpenFileName()
+        file_path, _ = QFileDialog.getOpenFileName(self)
         if file_path:
             self.epg_file_input.setText(file_path)
 
@@ -427,82 +515,83 @@ class OptionsDialog(QDialog):
             self.config_manager.channel_logos = self.channel_logos_checkbox.isChecked()
             need_to_refresh_content_list_size = True
 
-        if self.epg_source_combo.currentText() != self.config_manager.epg_source:
-            self.config_manager.epg_source = self.epg_source_combo.currentText()
-            self.epg_settings_modified = True
-        if self.config_manager.epg_url != self.epg_url_input.text():
-            self.config_manager.epg_url = self.epg_url_input.text()
-            self.epg_settings_modified = True
-        if self.config_manager.epg_file != self.epg_file_input.text():
-            self.config_manager.epg_file = self.epg_file_input.text()
-            self.epg_settings_modified = True
-        if self.config_manager.epg_expiration_value != self.epg_expiration_spinner.value():
-            self.config_manager.epg_expiration_value = self.epg_expiration_spinner.value()
-        if self.config_manager.epg_expiration_unit != self.epg_expiration_combo.currentText():
-            self.config_manager.epg_expiration_unit = self.epg_expiration_combo.currentText()
+        # The EPG widgets only exist once that tab has been opened
+        if self.epg_layout is not None:
+            if self.epg_source_combo.currentText() != self.config_manager.epg_source:
+                self.config_manager.epg_source = self.epg_source_combo.currentText()
+                self.epg_settings_modified = True
+            if self.config_manager.epg_url != self.epg_url_input.text():
+                self.config_manager.epg_url = self.epg_url_input.text()
+                self.epg_settings_modified = True
+            if self.config_manager.epg_file != self.epg_file_input.text():
+                self.config_manager.epg_file = self.epg_file_input.text()
+                self.epg_settings_modified = True
+            if self.config_manager.epg_expiration_value != self.epg_expiration_spinner.value():
+                self.config_manager.epg_expiration_value = self.epg_expiration_spinner.value()
+            if self.config_manager.epg_expiration_unit != self.epg_expiration_combo.currentText():
+                self.config_manager.epg_expiration_unit = self.epg_expiration_combo.currentText()
 
         if self.config_manager.selected_provider_name != self.selected_provider_name:
             self.config_manager.selected_provider_name = self.selected_provider_name
             current_provider_changed = True
 
         # Save the configuration
-        self.parent().save_config()
+        self.channel_list.save_config()
 
         if self.providers_modified:
             self.provider_manager.save_providers()
 
         if current_provider_changed:
-            self.parent().set_provider()
+            self.channel_list.set_provider()
         elif self.epg_settings_modified:
             self.epg_manager.set_current_epg()
-            self.parent().refresh_channels()
+            self.channel_list.refresh_channels()
         elif self.xmltv_mapping_modified:
             if self.config_manager.epg_source != "STB":
                 self.epg_manager.reindex_programs()
 
         if need_to_refresh_content_list_size:
-            self.parent().refresh_content_list_size()
+            self.channel_list.refresh_content_list_size()
 
         self.accept()
 
-    def get_cache_size(self):
-        cache_dir = self.parent().get_cache_directory()
-        total_size = 0
-        for dirpath, dirnames, filenames in os.walk(cache_dir):
-            for f in filenames:
-                fp = os.path.join(dirpath, f)
-                total_size += os.path.getsize(fp)
-        return total_size / (1024 * 1024)  # Convert to MB
-
     def load_file(self):
-        file_dialog = QFileDialog(self)
-        file_path, _ = file_dialog.getOpenFileName()
+        file_path, _ = QFileDialog.getOpenFileName(self)
         if file_path:
             self.url_input.setText(file_path)
             self.file_button.setVisible(False)
 
     def verify_provider(self):
         self.verify_result.setText("Verifying...")
-        self.verify_result.repaint()
-        result = False
-        url = self.url_input.text()
-
-        if self.type_STB.isChecked():
-            result = self.provider_manager.do_handshake(url, self.mac_input.text())
-        elif self.type_M3UPLAYLIST.isChecked() or self.type_M3USTREAM.isChecked():
+        self.verify_result.setStyleSheet("")
+        self.verify_button.setEnabled(False)
+        # The check runs off the UI thread, the inputs are read here
+        self.verify_thread = VerifyProviderThread(
+            self, self.checked_provider_type(), self.url_input.text(), self.mac_input.text()
+        )
+        self.verify_thread.verified.connect(self.provider_verified)
+        self.verify_thread.finished.connect(self.verify_thread.deleteLater)
+        self.verify_thread.start()
+
+    def check_provider(self, provider_type, url, mac):
+        if provider_type == "STB":
+            return self.provider_manager.verify_handshake(url, mac)
+        elif provider_type in ("M3UPLAYLIST", "M3USTREAM"):
             if url.startswith(("http://", "https://")):
-                result = self.verify_url(url)
-            else:
-                result = os.path.isfile(url)
-        elif self.type_XTREAM.isChecked():
-            result = self.verify_url(url)
+                return self.verify_url(url)
+            return os.path.isfile(url)
+        elif provider_type == "XTREAM":
+            return self.verify_url(url)
+        return False
 
+    def provider_verified(self, result):
         self.verify_result.setText(
             "Provider verified successfully."
             if result
             else "Failed to verify provider."
         )
         self.verify_result.setStyleSheet("color: green;" if result else "color: red;")
+        self.verify_button.setEnabled(True)
 
     def apply_provider(self):
         if self.edited_provider:
@@ -510,30 +599,27 @@ class OptionsDialog(QDialog):
             self.edited_provider["url"] = self.url_input.text()
             if not self.edited_provider["name"]:
                 self.edited_provider["name"] = self.edited_provider["url"]
-            if self.type_STB.isChecked():
-                self.edited_provider["type"] = "STB"
+            provider_type = self.checked_provider_type()
+            if provider_type:
+                self.edited_provider["type"] = provider_type
+            if provider_type == "STB":
                 self.edited_provider["mac"] = self.mac_input.text()
-            elif self.type_M3UPLAYLIST.isChecked():
-                self.edited_provider["type"] = "M3UPLAYLIST"
-            elif self.type_M3USTREAM.isChecked():
-                self.edited_provider["type"] = "M3USTREAM"
-            elif self.type_XTREAM.isChecked():
-                self.edited_provider["type"] = "XTREAM"
+            elif provider_type == "XTREAM":
                 self.edited_provider["username"] = self.username_input.text()
                 self.edited_provider["password"] = self.password_input.text()
             self.selected_provider_name = self.edited_provider["name"]
             self.provider_combo.setItemText(
                 self.selected_provider_index,
-                f"{self.selected_provider_index + 1}: {self.edited_provider['name']}",
+                self.provider_display_name(self.selected_provider_index, self.edited_provider),
             )
             self.providers_modified = True
 
     def clear_image_cache(self):
-        self.parent().image_manager.clear_cache()
-        self.cache_image_size_label = QLabel(f"Max size of image cache (actual size: {self.get_cache_image_size():.2f} MB)", self.settings_tab)
+        self.channel_list.image_manager.clear_cache()
+        self.cache_image_size_label.setText(f"Max size of image cache (actual size: {self.get_cache_image_size():.2f} MB)")
 
     def get_cache_image_size(self):
-        total_size = self.parent().image_manager.current_cache_size
+        total_size = self.channel_list.image_manager.current_cache_size
         return total_size / (1024 * 1024)  # Convert to MB
 
     def on_check_updates_toggled(self):
@@ -541,11 +627,25 @@ class OptionsDialog(QDialog):
             check_for_updates()
 
     def load_xmltv_channel_mapping(self):
-        self.xmltv_mapping_table.setRowCount(len(self.config_manager.xmltv_channel_map))
-        for row_position, (key, value) in enumerate(self.config_manager.xmltv_channel_map.items()):
-            self.xmltv_mapping_table.setItem(row_position, 0, QTableWidgetItem(value["name"]))
-            self.xmltv_mapping_table.setItem(row_position, 1, QTableWidgetItem(value.get("icon", "")))
-            self.xmltv_mapping_table.setItem(row_position, 2, QTableWidgetItem(", ".join(key)))
+        table = self.xmltv_mapping_table
+        header = table.horizontalHeader()
+        # Fill the table detached, sizing the name column once at the end
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setSortingEnabled(False)
+        header.setSectionResizeMode(0, QHeaderView.Interactive)
+        try:
+            mappings = list(self.config_manager.xmltv_channel_map.items())
+            table.setRowCount(len(mappings))
+            set_item = table.setItem
+            for row_position, (key, value) in enumerate(mappings):
+                set_item(row_position, 0, QTableWidgetItem(value["name"]))
+                set_item(row_position, 1, QTableWidgetItem(value.get("icon", "")))
+                set_item(row_position, 2, QTableWidgetItem(", ".join(key)))
+        finally:
+            header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
     def add_xmltv_mapping(self):
         dialog = AddXmltvMappingDialog(self)
@@ -640,11 +740,10 @@ class OptionsDialog(QDialog):
         self.load_xmltv_channel_mapping()
 
     def import_xmltv_mapping(self):
-        file_dialog = QFileDialog(self)
-        file_path, _ = file_dialog.getOpenFileName()
+        file_path, _ = QFileDialog.getOpenFileName(self)
         if file_path:
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
+                with open(file_path, "rb") as f:
                     list_channels = json.loads(f.read())
                 if list_channels is not None:
                     multiKey = MultiKeyDict()
@@ -660,22 +759,24 @@ class OptionsDialog(QDialog):
                 pass
 
     def export_xmltv_mapping(self):
-        file_dialog = QFileDialog(self)
-        file_path, _ = file_dialog.getSaveFileName()
+        file_path, _ = QFileDialog.getSaveFileName(self)
         if file_path:
-            with open(file_path if file_path.endswith(".json") else file_path + ".json", "w", encoding="utf-8") as f:
-                export = {}
-                for k,v in self.config_manager.xmltv_channel_map.items():
-                    mainKey = k[0].strip()
-                    export[mainKey] = v
-                    export[mainKey]["xmltv_id"] = list(k)
-                f.write(json.dumps(export, option=json.OPT_INDENT_2).decode("utf-8"))
+            export = {
+                k[0].strip(): {**v, "xmltv_id": list(k)}
+                for k, v in self.config_manager.xmltv_channel_map.items()
+            }
+            with open(file_path if file_path.endswith(".json") else file_path + ".json", "wb") as f:
+                f.write(json.dumps(export, option=json.OPT_INDENT_2))
 
-    @staticmethod
-    def verify_url(url):
+    def verify_url(self, url):
         if url.startswith(("http://", "https://")):
             try:
-                response = requests.head(url, timeout=5)
+                session = self.provider_manager.session
+                response = session.head(url, timeout=5, allow_redirects=True)
+                if response.status_code == 405:
+                    # HEAD not allowed, only read the status line of a GET
+                    with session.get(url, timeout=5, stream=True) as response:
+                        return response.status_code == 200
                 return response.status_code == 200
             except requests.RequestException as e:
                 print(f"Error verifying URL: {e}")
@@ -8,6 +8,8 @@ import orjson as json
 import requests
 import tzlocal
 from PySide6.QtCore import QObject, Signal
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urlobject import URLObject
 
 
@@ -27,6 +29,20 @@ class ProviderManager(QObject):
         self.current_provider_content = {}
         self.token = ""
         self.headers = {}
+        self.session = self.create_session()
+        # Only category listings retry, and only on transient gateway errors:
+        # a dead portal fails after one timeout, the last response is returned
+        self.categories_session = self.create_session(
+            Retry(
+                total=3,
+                connect=0,
+                read=0,
+                backoff_factor=0.5,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False,
+            )
+        )
         self._load_providers()
 
     def _current_provider_cache_name(self):
@@ -98,19 +114,29 @@ class ProviderManager(QObject):
         with open(self._current_provider_cache_name(), "w", encoding="utf-8") as f:
             f.write(serialized.decode("utf-8"))
 
-    def do_handshake(self, url, mac, serverload="/portal.php"):
-        self.token = self.token if self.token else self.random_token()
-        self.headers = self.create_headers(url, mac, self.token)
+    def do_handshake(self, url, mac):
+        self.token, self.headers, verified = self.handshake(
+            url, mac, self.token if self.token else self.random_token()
+        )
+        return verified
+
+    def verify_handshake(self, url, mac):
+        # Check a provider without replacing the current provider's token
+        return self.handshake(url, mac, self.random_token())[2]
+
+    def handshake(self, url, mac, token, serverload="/portal.php"):
+        # Returns (token, headers, verified) and leaves the manager state alone
+        headers = self.create_headers(url, mac, token)
         try:
             prehash = "2614ddf9829ba9d284f389d88e8c669d81f6a5c2"
             fetchurl = f"{url}{serverload}?type=stb&action=handshake&prehash={prehash}&token=&JsHttpRequest=1-xml"
-            handshake = requests.get(fetchurl, timeout=5, headers=self.headers)
+            handshake = self.session.get(fetchurl, timeout=5, headers=headers)
             if handshake.status_code == 200:
-                body = handshake.json()
+                body = json.loads(handshake.content)
             else:
                 raise Exception(f"Failed to fetch handshake: {handshake.status_code}")
-            self.token = body["js"]["token"]
-            self.headers["Authorization"] = f"Bearer {self.token}"
+            token = body["js"]["token"]
+            headers["Authorization"] = f"Bearer {token}"
 
             # Use get_profile request to detect blocked providers
 
@@ -137,9 +163,9 @@ class ProviderManager(QObject):
             encoded_params = urlencode(params)
 
             fetchurl = f"{url}{serverload}?type=stb&action=get_profile&hd=1&{encoded_params}&JsHttpRequest=1-xml"
-            profile = requests.get(fetchurl, timeout=5, headers=self.headers)
+            profile = self.session.get(fetchurl, timeout=5, headers=headers)
             if profile.status_code == 200:
-                body = profile.json()
+                body = json.loads(profile.content)
             else:
                 raise Exception(f"Failed to fetch profile: {profile.status_code}")
 
@@ -148,13 +174,13 @@ class ProviderManager(QObject):
             if not theId and not theName:
                 raise Exception("Provider is blocked")
 
-            return True
+            return token, headers, True
         except Exception as e:
             if serverload != "/server/load.php" and "handshake" in fetchurl:
                 serverload = "/server/load.php"
-                return self.do_handshake(url, mac, serverload)
+                return self.handshake(url, mac, token, serverload)
             print("Error in handshake:", e)
-            return False
+            return token, headers, False
 
     @staticmethod
     def default_providers():
@@ -166,6 +192,15 @@ class ProviderManager(QObject):
             }
         ]
 
+    @staticmethod
+    def create_session(max_retries=0):
+        # Session for portal requests, keeps connections alive between calls
+        adapter = HTTPAdapter(max_retries=max_retries, pool_maxsize=32)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     @staticmethod
     def random_token():
         return "".join(random.choices(string.ascii_letters + string.digits, k=32))
@@ -9,6 +9,9 @@ from PySide6.QtWidgets import QFrame, QMainWindow, QProgressBar, QVBoxLayout
 
 logging.basicConfig(level=logging.ERROR)
 
+# Resolved once, the platform does not change during a session
+PLATFORM = platform.system()
+
 
 class VLCLogger:
     def __init__(self):
@@ -99,6 +102,8 @@ class VideoPlayer(QMainWindow):
         self.update_timer = QTimer(self)
         self.update_timer.setInterval(100)  # Update every 100ms
         self.update_timer.timeout.connect(self.update_progress)
+        # Last (second, total, value) drawn, to skip redundant repaints
+        self.last_progress = None
 
         self.progress_bar.mousePressEvent = self.seek_video
 
@@ -124,36 +129,50 @@ class VideoPlayer(QMainWindow):
             return f"{minutes:02d}:{seconds:02d}"
 
     def update_progress(self):
-        state = self.media_player.get_state()
+        # Runs every 100ms while playing, keep the lookups local
+        progress_bar = self.progress_bar
+        media_player = self.media_player
+        state = media_player.get_state()
         if state == vlc.State.Playing:
-            current_time = self.media_player.get_time()
+            current_time = media_player.get_time()
             total_time = self.media.get_duration()
             # if we have current time, but if current time is bigger than total time then it is live stream so we go to else
             if current_time > 0 and current_time < total_time:
-                self.progress_bar.setVisible(True)
-                formatted_current = self.format_time(current_time)
-                formatted_total = self.format_time(total_time)
-                self.progress_bar.setFormat(f"{formatted_current} / {formatted_total}")
-                self.progress_bar.setValue(int(current_time * 1000 / total_time))
-            else:
-                self.progress_bar.setVisible(False)
-                self.progress_bar.setFormat("Live")
-                self.progress_bar.setValue(0)
+                # The label only shows whole seconds, skip ticks that change nothing
+                progress = (
+                    current_time // 1000,
+                    total_time // 1000,
+                    int(current_time * 1000 / total_time),
+                )
+                if progress == self.last_progress:
+                    return
+                self.last_progress = progress
+                format_time = self.format_time
+                progress_bar.setVisible(True)
+                progress_bar.setFormat(
+                    f"{format_time(current_time)} / {format_time(total_time)}"
+                )
+                progress_bar.setValue(progress[2])
+                return
+            progress_bar.setVisible(False)
+            progress_bar.setFormat("Live")
+            progress_bar.setValue(0)
         elif state == vlc.State.Error:
             self.handle_error("Playback error")
         elif state == vlc.State.Ended:
-            self.progress_bar.setFormat("Playback ended")
-            self.progress_bar.setValue(1000)  # Set to 100%
+            progress_bar.setFormat("Playback ended")
+            progress_bar.setValue(1000)  # Set to 100%
         elif state == vlc.State.Opening:
-            self.progress_bar.setFormat("Opening...")
-            self.progress_bar.setValue(0)
+            progress_bar.setFormat("Opening...")
+            progress_bar.setValue(0)
         elif state == vlc.State.Buffering:
-            self.progress_bar.setFormat("Buffering...")
-            self.progress_bar.setValue(0)
+            progress_bar.setFormat("Buffering...")
+            progress_bar.setValue(0)
+        self.last_progress = None
 
     def wheelEvent(self, event):
         delta = event.angleDelta().y()
-        if platform.system() == "Darwin":
+        if PLATFORM == "Darwin":
             delta = -delta
         if delta > 0:
             self.change_volume(10)  # Increase volume
@@ -217,11 +236,11 @@ class VideoPlayer(QMainWindow):
         event.ignore()
 
     def play_video(self, video_url):
-        if platform.system() == "Linux":
+        if PLATFORM == "Linux":
             self.media_player.set_xwindow(self.video_frame.winId())
-        elif platform.system() == "Windows":
+        elif PLATFORM == "Windows":
             self.media_player.set_hwnd(self.video_frame.winId())
-        elif platform.system() == "Darwin":
+        elif PLATFORM == "Darwin":
             self.media_player.set_nsobject(int(self.video_frame.winId()))
 
         self.media = self.instance.media_new(video_url)
@@ -425,6 +444,7 @@ class VideoPlayer(QMainWindow):
         if duration > 0:  # VOD content
             self.progress_bar.setVisible(True)
             self.progress_bar.setFormat("00:00 / " + self.format_time(duration))
+            self.last_progress = None
             self.update_timer.start()
         else:  # Live content
             self.progress_bar.setVisible(False)  # Hide the progress bar